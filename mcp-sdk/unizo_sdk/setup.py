@@ -1,3 +1,4 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
 setup(
@@ -15,10 +16,14 @@ setup(
         "openai>=1.0.0",
         "python-dotenv>=1.0.0"
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0"],
+        "test": ["pytest", "pytest-asyncio"],
+    },
     author="Paul",
     author_email="your.email@example.com",
     description="Unizo MCP SDK for ticketing server",
-    long_description=open("README.md").read(),
+    long_description=Path(__file__).parent.joinpath("README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     url="https://github.com/your-org/unizo-sdk",
 )
\ No newline at end of file
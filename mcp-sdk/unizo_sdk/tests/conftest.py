@@ -6,6 +6,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from types import SimpleNamespace
 
 
+# Live-API scripts run via their own main() (python -m tests.test_crewai);
+# they hold no test functions, so pytest should not import them
+collect_ignore = ["test_crewai.py", "test_langchain.py"]
+
+
 # ---------------------------------------------------------------------------
 # Fake MCP tool objects returned by session.list_tools()
 # ---------------------------------------------------------------------------
@@ -70,13 +75,18 @@ MOCK_TOOLS = [
 ]
 
 
+# Successful call_tool() payload, serialised once at import time
+_OK_PAYLOAD = {"status": "ok", "ticket_id": "T-001"}
+_OK_TEXT = json.dumps(_OK_PAYLOAD)
+
+
 @pytest.fixture
 def mock_tools():
     """Return the list of mock MCP tool objects."""
     return MOCK_TOOLS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_list_tools_response():
     """Return a mock response object whose `.tools` attribute is MOCK_TOOLS."""
     response = SimpleNamespace()
@@ -84,22 +94,66 @@ def mock_list_tools_response():
     return response
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def ok_payload():
+    """Return the decoded form of the successful call_tool() payload."""
+    return _OK_PAYLOAD
+
+
+@pytest.fixture(scope="session")
 def mock_call_tool_result():
     """Return a mock result from session.call_tool()."""
     content_item = SimpleNamespace()
-    content_item.text = json.dumps({"status": "ok", "ticket_id": "T-001"})
+    content_item.text = _OK_TEXT
     result = SimpleNamespace()
     result.structuredContent = None
     result.content = [content_item]
     return result
 
 
+@pytest.fixture(scope="session")
+def mock_call_tool_responses(mock_call_tool_result):
+    """Return pre-built session.call_tool() results keyed by scenario.
+
+    Tests pick one with ``mock_session.call_tool.return_value = ...["structured"]``
+    instead of assembling a fresh result object each time.
+    """
+    structured = SimpleNamespace()
+    structured.structuredContent = {"status": "structured_ok"}
+    structured.content = []
+
+    empty = SimpleNamespace()
+    empty.structuredContent = None
+    empty.content = []
+
+    return {"ok": mock_call_tool_result, "structured": structured, "empty": empty}
+
+
 @pytest.fixture
 def mock_session(mock_list_tools_response, mock_call_tool_result):
-    """Return an AsyncMock that behaves like a ClientSession."""
+    """Return an AsyncMock that behaves like a ClientSession.
+
+    The response objects are session-scoped and shared; the mock itself stays
+    function-scoped because copying an AsyncMock shares its child mocks, so
+    ``call_tool.side_effect`` set in one test would leak into the next.
+    """
     session = AsyncMock()
     session.initialize = AsyncMock()
     session.list_tools = AsyncMock(return_value=mock_list_tools_response)
     session.call_tool = AsyncMock(return_value=mock_call_tool_result)
     return session
+
+
+@pytest.fixture
+def make_toolset(mock_session):
+    """Return a factory that builds a toolset and injects the mock session.
+
+    Each call constructs a fresh instance so per-instance state such as the
+    exit stack and cache locks is never shared between tests.
+    """
+    def _make(toolset_cls, **kwargs):
+        toolset = toolset_cls(api_key="test_key", **kwargs)
+        # Inject mock session so connect() is never called
+        toolset.session = mock_session
+        return toolset
+    return _make
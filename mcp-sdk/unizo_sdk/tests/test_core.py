@@ -1,20 +1,34 @@
 """Unit tests for unizo_core — client, actions, models, and exceptions."""
 
+import asyncio
 import json
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from types import SimpleNamespace
 
-from unizo_core.client import UnizoToolSet
-from unizo_core.actions import Action
+import pydantic.json_schema
+from pydantic import ValidationError, create_model
+
+import unizo_core._json as _json
+import unizo_core.client as client_module
+from unizo_core.client import DEFAULT_SERVER_URL, UnizoToolSet, _parse_schema
+from unizo_core.actions import ACTION_BY_NAME, Action
 from unizo_core.models import (
+    ACTION_SCHEMAS,
+    NoArgs,
     TicketData,
     Service,
     Integration,
     Organization,
     Collection,
     TicketSummary,
+    ArgsSchema,
 )
+import unizo_core.schema_builder as schema_builder
+from unizo_core.schema_builder import build_args_schema
 from unizo_core.exceptions import UnizoError, AuthenticationError, ToolExecutionError
 
 
@@ -31,6 +45,7 @@ class TestUnizoToolSetInit:
         assert ts.api_key == "key_abc123"
         assert ts.session is None
         assert "unizo.ai" in ts.server_url  # default URL
+        assert ts.server_url == DEFAULT_SERVER_URL
 
     def test_custom_server_url(self):
         ts = UnizoToolSet(api_key="key_abc123", server_url="http://localhost:8080")
@@ -44,6 +59,108 @@ class TestUnizoToolSetInit:
         with pytest.raises((ValueError, TypeError)):
             UnizoToolSet(api_key=None)
 
+    @pytest.mark.parametrize("module_name,class_name", [
+        ("unizo_core.client", "UnizoToolSet"),
+        ("unizo_crewai.toolset", "UnizoCrewAIToolSet"),
+        ("unizo_langchain.toolset", "UnizoLangChainToolSet"),
+        ("unizo_openai.toolset", "UnizoOpenAIToolSet"),
+    ])
+    def test_toolsets_use_slots(self, module_name, class_name, make_toolset):
+        import importlib
+
+        toolset_cls = getattr(importlib.import_module(module_name), class_name)
+        kwargs = {"openai_api_key": "sk-test"} if class_name == "UnizoOpenAIToolSet" else {}
+        with patch("unizo_openai.toolset.AsyncOpenAI"):
+            toolset = make_toolset(toolset_cls, **kwargs)
+        assert not hasattr(toolset, "__dict__")
+        with pytest.raises(AttributeError):
+            toolset.undeclared_attribute = 1
+
+
+class TestLifecycle:
+    """The toolset holds one SSE session per ``async with`` block."""
+
+    @pytest.mark.asyncio
+    async def test_context_manager_connects_and_cleans_up(self):
+        with patch.object(UnizoToolSet, "connect", AsyncMock()) as connect, \
+                patch.object(UnizoToolSet, "cleanup", AsyncMock()) as cleanup:
+            async with UnizoToolSet(api_key="key_abc123") as ts:
+                assert isinstance(ts, UnizoToolSet)
+                connect.assert_awaited_once()
+                cleanup.assert_not_awaited()
+            cleanup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_runs_when_block_raises(self):
+        with patch.object(UnizoToolSet, "connect", AsyncMock()), \
+                patch.object(UnizoToolSet, "cleanup", AsyncMock()) as cleanup:
+            with pytest.raises(RuntimeError):
+                async with UnizoToolSet(api_key="key_abc123"):
+                    raise RuntimeError("boom")
+            cleanup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_connect_is_noop_when_session_open(self, mock_session):
+        ts = UnizoToolSet(api_key="key_abc123")
+        ts.session = mock_session
+        with patch("unizo_core.client.sse_client") as sse:
+            await ts.connect()
+        sse.assert_not_called()
+        assert ts.session is mock_session
+
+    @pytest.mark.asyncio
+    async def test_cleanup_unwinds_session_then_streams(self, mock_session):
+        events = []
+
+        @asynccontextmanager
+        async def fake_sse_client(url, headers):
+            events.append("streams open")
+            yield ("read", "write")
+            events.append("streams closed")
+
+        @asynccontextmanager
+        async def fake_client_session(read, write):
+            events.append("session open")
+            yield mock_session
+            events.append("session closed")
+
+        ts = UnizoToolSet(api_key="key_abc123")
+        with patch("unizo_core.client.sse_client", fake_sse_client), \
+                patch("unizo_core.client.ClientSession", fake_client_session):
+            await ts.connect()
+            assert ts.session is mock_session
+            await ts.cleanup()
+
+        assert events == ["streams open", "session open", "session closed", "streams closed"]
+        assert ts.session is None
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_unwinds_and_can_retry(self, mock_session):
+        events = []
+
+        @asynccontextmanager
+        async def fake_sse_client(url, headers):
+            events.append("streams open")
+            yield ("read", "write")
+            events.append("streams closed")
+
+        @asynccontextmanager
+        async def fake_client_session(read, write):
+            yield mock_session
+
+        mock_session.initialize.side_effect = [RuntimeError("handshake failed"), None]
+        ts = UnizoToolSet(api_key="key_abc123")
+        with patch("unizo_core.client.sse_client", fake_sse_client), \
+                patch("unizo_core.client.ClientSession", fake_client_session):
+            with pytest.raises(RuntimeError, match="handshake failed"):
+                await ts.connect()
+            assert ts.session is None
+            assert events == ["streams open", "streams closed"]
+
+            await ts.connect()
+            assert ts.session is mock_session
+            await ts.cleanup()
+
 
 # ===================================================================
 # Action enum
@@ -64,17 +181,24 @@ class TestAction:
         "HEALTH_CHECK": "health_check",
     }
 
-    def test_all_members_present(self):
-        for member_name in self.EXPECTED:
-            assert hasattr(Action, member_name), f"Missing enum member: {member_name}"
+    @pytest.mark.parametrize("member_name", list(EXPECTED))
+    def test_member_present(self, member_name):
+        assert hasattr(Action, member_name), f"Missing enum member: {member_name}"
 
-    def test_values(self):
-        for member_name, expected_value in self.EXPECTED.items():
-            assert Action[member_name].value == expected_value
+    @pytest.mark.parametrize("member_name,expected_value", list(EXPECTED.items()))
+    def test_value(self, member_name, expected_value):
+        assert Action[member_name].value == expected_value
 
     def test_total_count(self):
         assert len(Action) == len(self.EXPECTED)
 
+    @pytest.mark.parametrize("member_name,tool_name", list(EXPECTED.items()))
+    def test_action_by_name(self, member_name, tool_name):
+        assert ACTION_BY_NAME[tool_name] is Action[member_name]
+
+    def test_action_by_name_covers_values(self):
+        assert frozenset(ACTION_BY_NAME) == frozenset(self.EXPECTED.values())
+
 
 # ===================================================================
 # Pydantic models
@@ -129,6 +253,122 @@ class TestOtherModels:
         assert ts.status == "OPEN"
 
 
+class TestArgsSchema:
+    """The default JSON schema of an args model is generated once per class."""
+
+    def _make_model(self):
+        return create_model("cachedSchema", __base__=ArgsSchema, foo=(str, ...))
+
+    def test_schema_generated_once(self):
+        model = self._make_model()
+        with patch(
+            "pydantic.main.model_json_schema", wraps=pydantic.json_schema.model_json_schema
+        ) as generate:
+            first = model.model_json_schema()
+            second = model.model_json_schema()
+        assert first == second
+        assert generate.call_count == 1
+
+    def test_returns_independent_copies(self):
+        model = self._make_model()
+        model.model_json_schema()["properties"].clear()
+        assert "foo" in model.model_json_schema()["properties"]
+
+    def test_non_default_arguments_bypass_cache(self):
+        model = self._make_model()
+        schema = model.model_json_schema(mode="serialization")
+        assert "foo" in schema["properties"]
+        assert "__json_schema_cache__" not in model.__dict__
+
+
+class TestSchemaBuilder:
+    """build_args_schema() shares one model class per tool schema."""
+
+    SCHEMA = {
+        "type": "object",
+        "properties": {"count": {"type": "integer"}, "label": {"type": "string"}},
+        "required": ["count"],
+    }
+
+    def test_reordered_schema_reuses_model(self):
+        reordered = {
+            "required": ["count"],
+            "properties": {"label": {"type": "string"}, "count": {"type": "integer"}},
+            "type": "object",
+        }
+        assert build_args_schema("builder_tool", self.SCHEMA) is build_args_schema(
+            "builder_tool", reordered
+        )
+
+    def test_different_tool_name_gets_own_model(self):
+        assert build_args_schema("builder_tool", self.SCHEMA) is not build_args_schema(
+            "other_builder_tool", self.SCHEMA
+        )
+
+    def test_fields_and_requiredness(self):
+        model = build_args_schema("builder_tool", self.SCHEMA)
+        assert model.model_fields["count"].is_required()
+        assert not model.model_fields["label"].is_required()
+        assert issubclass(model, ArgsSchema)
+
+    @pytest.mark.asyncio
+    async def test_shared_between_adapters(self, make_toolset):
+        from unizo_crewai.toolset import UnizoCrewAIToolSet
+        from unizo_langchain.toolset import UnizoLangChainToolSet
+
+        crewai_tools = await make_toolset(UnizoCrewAIToolSet).get_tools([Action.CREATE_TICKET])
+        langchain_tools = await make_toolset(UnizoLangChainToolSet).get_tools([Action.CREATE_TICKET])
+        assert crewai_tools[0].args_schema is langchain_tools[0].args_schema
+
+    @pytest.mark.parametrize("schema_type,expected", [
+        ("string", str),
+        ("integer", int),
+        ("number", float),
+        ("boolean", bool),
+        ("array", list),
+        ("object", dict),
+        ("unknown", str),
+        (None, str),
+        (["string", "null"], str),
+        (["null", "integer"], int),
+        (["null"], str),
+        ({"not": "a type"}, str),
+    ])
+    def test_type_mapping(self, schema_type, expected):
+        prop = {} if schema_type is None else {"type": schema_type}
+        tool_name = f"typed_{json.dumps(schema_type)}"
+        model = build_args_schema(tool_name, {"properties": {"value": prop}, "required": ["value"]})
+        assert model.model_fields["value"].annotation is expected
+        assert model.model_fields["value"].is_required()
+
+    @pytest.mark.parametrize("action", [Action.LIST_SERVICES, Action.HEALTH_CHECK])
+    def test_known_action_reuses_hand_written_model(self, action, monkeypatch):
+        monkeypatch.setattr(schema_builder, "_SCHEMA_CACHE", OrderedDict())
+        with patch("unizo_core.schema_builder.create_model") as create:
+            model = build_args_schema(action.value, {"type": "object", "properties": {}, "required": []})
+        assert model is ACTION_SCHEMAS[action] is NoArgs
+        create.assert_not_called()
+
+    def test_drifted_known_action_builds_model(self, monkeypatch):
+        monkeypatch.setattr(schema_builder, "_SCHEMA_CACHE", OrderedDict())
+        drifted = {"type": "object", "properties": {"verbose": {"type": "boolean"}}, "required": []}
+        model = build_args_schema("health_check", drifted)
+        assert model is not NoArgs
+        assert set(model.model_fields) == {"verbose"}
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr(schema_builder, "_SCHEMA_CACHE", OrderedDict())
+        monkeypatch.setattr(schema_builder, "_SCHEMA_CACHE_MAXSIZE", 2)
+
+        first = build_args_schema("lru_a", self.SCHEMA)
+        build_args_schema("lru_b", self.SCHEMA)
+        assert build_args_schema("lru_a", self.SCHEMA) is first  # refreshes lru_a
+        build_args_schema("lru_c", self.SCHEMA)                  # evicts lru_b
+
+        assert len(schema_builder._SCHEMA_CACHE) == 2
+        assert [name for name, _ in schema_builder._SCHEMA_CACHE] == ["lru_a", "lru_c"]
+
+
 # ===================================================================
 # Exception hierarchy
 # ===================================================================
@@ -164,10 +404,8 @@ class TestGetTools:
     """Test UnizoToolSet.get_tools() with a mock session injected."""
 
     @pytest.fixture(autouse=True)
-    def setup_toolset(self, mock_session):
-        self.toolset = UnizoToolSet(api_key="test_key")
-        # Inject mock session so connect() is never called
-        self.toolset.session = mock_session
+    def setup_toolset(self, make_toolset):
+        self.toolset = make_toolset(UnizoToolSet)
 
     @pytest.mark.asyncio
     async def test_returns_all_tools(self):
@@ -187,6 +425,41 @@ class TestGetTools:
             assert "parameters" in tool
             assert tool["parameters"]["type"] == "object"
 
+    @pytest.mark.asyncio
+    async def test_properties_not_wrapped_in_whole_schema(self, mock_tools):
+        tools = await self.toolset.get_tools(actions=[Action.CREATE_TICKET])
+        params = tools[0]["parameters"]
+        source = next(t for t in mock_tools if t.name == "create_ticket").inputSchema
+        assert set(params["properties"]) == set(source["properties"])
+        assert params["properties"] is source["properties"]  # shared, not copied
+        assert params["required"] == source["required"]
+
+    @pytest.mark.asyncio
+    async def test_flat_schema_used_as_properties(self, mock_session):
+        flat_tool = SimpleNamespace(
+            name="flat_tool", description="Flat", inputSchema={"query": {"type": "string"}}
+        )
+        mock_session.list_tools.return_value = SimpleNamespace(tools=[flat_tool])
+        self.toolset.invalidate_tools_cache()
+        tools = await self.toolset.get_tools()
+        assert tools[0]["parameters"]["properties"] == {"query": {"type": "string"}}
+        assert tools[0]["parameters"]["required"] == []
+
+    @pytest.mark.parametrize("input_schema", [
+        {"type": "object"},
+        {"type": "object", "additionalProperties": False},
+        {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object"},
+        json.dumps({"type": "object"}),
+    ])
+    @pytest.mark.asyncio
+    async def test_schema_without_properties_has_no_arguments(self, mock_session, input_schema):
+        tool = SimpleNamespace(name="no_args_tool", description="No args", inputSchema=input_schema)
+        mock_session.list_tools.return_value = SimpleNamespace(tools=[tool])
+        self.toolset.invalidate_tools_cache()
+        tools = await self.toolset.get_tools()
+        assert tools[0]["parameters"]["properties"] == {}
+        assert tools[0]["parameters"]["required"] == []
+
     @pytest.mark.asyncio
     async def test_filter_by_single_action(self):
         tools = await self.toolset.get_tools(actions=[Action.CREATE_TICKET])
@@ -207,6 +480,79 @@ class TestGetTools:
         # LIST_INTEGRATIONS is not in the mock tools list
         assert tools == []
 
+    @pytest.mark.asyncio
+    async def test_filter_follows_caller_order_without_duplicates(self):
+        tools = await self.toolset.get_tools(
+            actions=[Action.HEALTH_CHECK, Action.CREATE_TICKET, Action.HEALTH_CHECK]
+        )
+        assert [t["name"] for t in tools] == ["health_check", "create_ticket"]
+
+    @pytest.mark.asyncio
+    async def test_filter_accepts_generator(self):
+        actions = (a for a in [Action.LIST_SERVICES, Action.HEALTH_CHECK])
+        tools = await self.toolset.get_tools(actions=actions)
+        assert [t["name"] for t in tools] == ["list_services", "health_check"]
+
+    @pytest.mark.asyncio
+    async def test_empty_actions_short_circuits(self, mock_session):
+        assert await self.toolset.get_tools(actions=[]) == []
+        mock_session.list_tools.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_tools_cached_across_calls(self, mock_session):
+        await self.toolset.get_tools()
+        tools = await self.toolset.get_tools(actions=[Action.CREATE_TICKET])
+        assert tools[0]["name"] == "create_ticket"
+        mock_session.list_tools.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tools_cache_refetches(self, mock_session):
+        await self.toolset.get_tools()
+        self.toolset.invalidate_tools_cache()
+        await self.toolset.get_tools()
+        assert mock_session.list_tools.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_filter_builds_only_wanted_schemas(self):
+        with patch.object(UnizoToolSet, "_tool_schema", side_effect=UnizoToolSet._tool_schema) as build:
+            await self.toolset.get_tools(actions=[Action.CREATE_TICKET])
+            assert [c.args[0].name for c in build.call_args_list] == ["create_ticket"]
+            first = await self.toolset.get_tools(actions=[Action.CREATE_TICKET, Action.HEALTH_CHECK])
+            assert [c.args[0].name for c in build.call_args_list] == ["create_ticket", "health_check"]
+        again = await self.toolset.get_tools(actions=[Action.CREATE_TICKET])
+        assert again[0] is first[0]
+
+    @pytest.mark.asyncio
+    async def test_debug_logs_not_formatted_when_disabled(self, mock_session, caplog):
+        reprs = []
+
+        class Tracked:
+            def __repr__(self):
+                reprs.append(1)
+                return "tracked"
+
+        tool = SimpleNamespace(
+            name="tracked_tool", description="Tracked",
+            inputSchema={"properties": {"x": Tracked()}, "required": []},
+        )
+        mock_session.list_tools.return_value = SimpleNamespace(tools=[tool])
+        self.toolset.invalidate_tools_cache()
+
+        caplog.set_level(logging.INFO, logger="unizo-core")
+        await self.toolset.get_tools()
+        assert reprs == []
+
+        self.toolset.invalidate_tools_cache()
+        caplog.set_level(logging.DEBUG, logger="unizo-core")
+        await self.toolset.get_tools()
+        assert reprs
+        assert "Tool schemas:" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_fetch_once(self, mock_session):
+        await asyncio.gather(*(self.toolset.get_tools() for _ in range(5)))
+        mock_session.list_tools.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_json_string_input_schema(self, mock_session):
         """If inputSchema is a JSON string, get_tools should parse it."""
@@ -226,6 +572,95 @@ class TestGetTools:
         assert len(tools) == 1
         assert "foo" in tools[0]["parameters"]["properties"]
 
+    @pytest.mark.asyncio
+    async def test_json_string_input_schema_parsed_once(self, mock_session, monkeypatch):
+        """A refetched tool list should reuse the parsed string schema."""
+        string_schema_tool = SimpleNamespace()
+        string_schema_tool.name = "cached_schema_tool"
+        string_schema_tool.description = "Tool with JSON-string schema"
+        string_schema_tool.inputSchema = json.dumps({
+            "type": "object",
+            "properties": {"bar": {"type": "integer"}},
+            "required": [],
+        })
+        resp = SimpleNamespace()
+        resp.tools = [string_schema_tool]
+        mock_session.list_tools.return_value = resp
+
+        calls = []
+        real_loads = client_module._loads
+
+        def counting_loads(raw):
+            calls.append(raw)
+            return real_loads(raw)
+
+        _parse_schema.cache_clear()
+        monkeypatch.setattr(client_module, "_loads", counting_loads)
+        await self.toolset.get_tools()
+        # Drop the per-toolset memo so the second pass goes through _parse_schema
+        self.toolset.invalidate_tools_cache()
+        await self.toolset.get_tools()
+        assert mock_session.list_tools.await_count == 2
+        assert calls == [string_schema_tool.inputSchema]
+
+    @pytest.mark.asyncio
+    async def test_mutating_result_leaves_cached_parse_intact(self, mock_session):
+        raw = json.dumps({
+            "type": "object",
+            "properties": {"bar": {"type": "integer"}},
+            "required": ["bar"],
+        })
+        tool = SimpleNamespace(name="frozen_schema_tool", description="Frozen", inputSchema=raw)
+        mock_session.list_tools.return_value = SimpleNamespace(tools=[tool])
+        self.toolset.invalidate_tools_cache()
+
+        params = (await self.toolset.get_tools())[0]["parameters"]
+        params["properties"]["bar"]["type"] = "string"
+        params["properties"]["injected"] = {}
+        params["required"].append("injected")
+
+        cached = _parse_schema(raw)
+        assert cached["properties"]["bar"]["type"] == "integer"
+        assert cached["required"] == ("bar",)
+        with pytest.raises(TypeError):
+            cached["properties"]["bar"]["type"] = "string"
+
+        self.toolset.invalidate_tools_cache()
+        fresh = (await self.toolset.get_tools())[0]["parameters"]
+        assert fresh["properties"] == {"bar": {"type": "integer"}}
+        assert fresh["required"] == ["bar"]
+
+
+# ===================================================================
+# JSON codec
+# ===================================================================
+
+
+class TestJsonCodec:
+    """The orjson-backed codec is a drop-in for the stdlib one."""
+
+    def test_dumps_returns_str(self):
+        assert isinstance(_json.dumps({"a": 1}), str)
+
+    @pytest.mark.parametrize("payload", [
+        {"ticket": {"id": "T-1", "tags": ["a", "b"], "open": True, "count": 3}},
+        {1: "int key", 2: {3: "nested"}},
+        {"big": 2**70, "small": -(2**70), "edge": 2**64},
+    ])
+    def test_round_trip(self, payload):
+        expected = json.loads(json.dumps(payload))
+        assert _json.loads(_json.dumps(payload)) == expected
+        assert json.loads(_json.dumps(payload)) == expected
+
+    def test_big_int_decoded_exactly(self):
+        raw = "123456789012345678901234567890"
+        assert _json.loads(raw) == int(raw)
+        assert _json.loads(raw.encode()) == int(raw)
+
+    def test_decode_error_is_stdlib_compatible(self):
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads("{not json")
+
 
 # ===================================================================
 # execute_action — with a mocked MCP session
@@ -236,20 +671,32 @@ class TestExecuteAction:
     """Test UnizoToolSet.execute_action() with a mock session."""
 
     @pytest.fixture(autouse=True)
-    def setup_toolset(self, mock_session):
-        self.toolset = UnizoToolSet(api_key="test_key")
-        self.toolset.session = mock_session
+    def setup_toolset(self, make_toolset, mock_session):
+        self.toolset = make_toolset(UnizoToolSet)
         self.mock_session = mock_session
 
     @pytest.mark.asyncio
-    async def test_successful_execution(self):
+    async def test_successful_execution(self, ok_payload):
         result = await self.toolset.execute_action(
             Action.CREATE_TICKET,
             {"ticket_name": "Test", "integration_id": "i1", "organization_id": "o1", "collection_id": "c1"},
         )
-        assert result["status"] == "ok"
+        assert result == ok_payload
         assert result["ticket_id"] == "T-001"
 
+    @pytest.mark.asyncio
+    async def test_large_text_payload(self):
+        """A ~1MB text result should round-trip through the decoder intact."""
+        payload = {"tickets": [{"id": f"T-{i}", "name": "x" * 90} for i in range(10_000)]}
+        content_item = SimpleNamespace(text=json.dumps(payload))
+        assert len(content_item.text) > 1_000_000
+        self.mock_session.call_tool.return_value = SimpleNamespace(
+            structuredContent=None, content=[content_item]
+        )
+
+        result = await self.toolset.execute_action(Action.LIST_TICKETS, {"collection_id": "c1"})
+        assert result == payload
+
     @pytest.mark.asyncio
     async def test_calls_session_call_tool(self):
         await self.toolset.execute_action(Action.HEALTH_CHECK, {})
@@ -262,13 +709,26 @@ class TestExecuteAction:
             await self.toolset.execute_action(Action.HEALTH_CHECK, {})
 
     @pytest.mark.asyncio
-    async def test_structured_content_preferred(self):
+    async def test_structured_content_preferred(self, mock_call_tool_responses):
         """When structuredContent is present, it should be returned."""
-        structured = {"status": "structured_ok"}
-        result_obj = SimpleNamespace()
-        result_obj.structuredContent = structured
-        result_obj.content = []
-        self.mock_session.call_tool.return_value = result_obj
+        self.mock_session.call_tool.return_value = mock_call_tool_responses["structured"]
 
         result = await self.toolset.execute_action(Action.HEALTH_CHECK, {})
-        assert result == structured
+        assert result == {"status": "structured_ok"}
+
+    @pytest.mark.asyncio
+    async def test_empty_content_returns_empty_list(self, mock_call_tool_responses):
+        self.mock_session.call_tool.return_value = mock_call_tool_responses["empty"]
+
+        result = await self.toolset.execute_action(Action.HEALTH_CHECK, {})
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_non_text_blocks_skipped(self, ok_payload):
+        image = SimpleNamespace(type="image", data="aGk=")
+        text = SimpleNamespace(type="text", text=json.dumps(ok_payload))
+        self.mock_session.call_tool.return_value = SimpleNamespace(content=[image, text])
+
+        result = await self.toolset.execute_action(Action.HEALTH_CHECK, {})
+        assert result == ok_payload
+
@@ -1,11 +1,19 @@
 """Unit tests for the CrewAI adapter (unizo_crewai.toolset)."""
 
+import asyncio
+import subprocess
+from contextlib import asynccontextmanager
+import sys
+from pathlib import Path
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from types import SimpleNamespace
 
 from unizo_core.actions import Action
 
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
 
 # ===================================================================
 # CrewAI BaseTool conversion
@@ -17,11 +25,10 @@ class TestCrewAIToolConversion:
     CrewAI BaseTool instances."""
 
     @pytest.fixture(autouse=True)
-    def setup_toolset(self, mock_session):
+    def setup_toolset(self, make_toolset):
         from unizo_crewai.toolset import UnizoCrewAIToolSet
 
-        self.toolset = UnizoCrewAIToolSet(api_key="test_key")
-        self.toolset.session = mock_session
+        self.toolset = make_toolset(UnizoCrewAIToolSet)
 
     @pytest.mark.asyncio
     async def test_returns_list(self):
@@ -90,11 +97,10 @@ class TestCrewAIToolSchema:
     """Deeper inspection of the dynamic Pydantic schema on CrewAI tools."""
 
     @pytest.fixture(autouse=True)
-    def setup_toolset(self, mock_session):
+    def setup_toolset(self, make_toolset):
         from unizo_crewai.toolset import UnizoCrewAIToolSet
 
-        self.toolset = UnizoCrewAIToolSet(api_key="test_key")
-        self.toolset.session = mock_session
+        self.toolset = make_toolset(UnizoCrewAIToolSet)
 
     @pytest.mark.asyncio
     async def test_schema_json_serialisable(self):
@@ -124,3 +130,129 @@ class TestCrewAIToolSchema:
             field = schema.model_fields.get(field_name)
             assert field is not None, f"Missing field: {field_name}"
             assert field.is_required(), f"Field {field_name} should be required"
+
+    @pytest.mark.asyncio
+    async def test_args_schema_reused_across_calls(self):
+        first = await self.toolset.get_tools(actions=[Action.CREATE_TICKET])
+        second = await self.toolset.get_tools(actions=[Action.CREATE_TICKET])
+        assert first[0].args_schema is second[0].args_schema
+
+
+
+# ===================================================================
+# Synchronous execution
+# ===================================================================
+
+
+class TestSyncRun:
+    """_run() reuses one event loop instead of building a new one per call."""
+
+    @pytest.fixture(autouse=True)
+    def setup_toolset(self, make_toolset, mock_session):
+        from unizo_core.schema_builder import build_args_schema
+        from unizo_crewai.toolset import UnizoCrewAITool, UnizoCrewAIToolSet
+
+        self.toolset = make_toolset(UnizoCrewAIToolSet)
+        self.session = mock_session
+        self.tool = UnizoCrewAITool(
+            name="health_check",
+            description="Check server health",
+            toolset=self.toolset,
+            action=Action.HEALTH_CHECK,
+            args_schema=build_args_schema("health_check", {"type": "object", "properties": {}}),
+        )
+        yield
+        self.toolset._stop_bg_loop()
+
+    def test_background_loop_reused_across_calls(self, ok_payload):
+        assert self.tool._run() == ok_payload
+        loop, thread = self.toolset._bg_loop, self.toolset._bg_thread
+        assert self.tool._run() == ok_payload
+        assert self.toolset._bg_loop is loop
+        assert self.toolset._bg_thread is thread
+        assert thread.is_alive()
+        assert self.session.call_tool.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_worker_thread_uses_session_loop(self, ok_payload):
+        self.toolset._session_loop = asyncio.get_running_loop()
+        assert await asyncio.to_thread(self.tool._run) == ok_payload
+        assert self.toolset._bg_loop is None
+
+    @pytest.mark.asyncio
+    async def test_blocking_on_owning_loop_returns_error(self):
+        self.toolset._session_loop = asyncio.get_running_loop()
+        result = self.tool._run()
+        assert "error" in result
+        self.session.call_tool.assert_not_awaited()
+
+    def test_session_opened_by_sync_call_is_cleaned_up(self, mock_session, ok_payload):
+        """The session opened lazily on the background loop closes from the task that opened it."""
+        import anyio
+
+        events = []
+
+        @asynccontextmanager
+        async def fake_sse_client(url, headers):
+            # A task group's cancel scope must be exited by the task that entered it
+            async with anyio.create_task_group():
+                events.append("streams open")
+                yield ("read", "write")
+                events.append("streams closed")
+
+        @asynccontextmanager
+        async def fake_client_session(read, write):
+            yield mock_session
+
+        self.toolset.session = None
+        with patch("unizo_core.client.sse_client", fake_sse_client), \
+                patch("unizo_core.client.ClientSession", fake_client_session):
+            assert self.tool._run() == ok_payload
+            assert self.tool._run() == ok_payload
+            thread = self.toolset._bg_thread
+            asyncio.run(self.toolset.cleanup())
+
+        assert events == ["streams open", "streams closed"]
+        mock_session.initialize.assert_awaited_once()
+        assert self.toolset.session is None
+        assert self.toolset._bg_loop is None
+        assert not thread.is_alive()
+
+    def test_result_wait_is_bounded(self, monkeypatch):
+        import unizo_crewai.toolset as crewai_toolset
+
+        monkeypatch.setattr(crewai_toolset, "_TOOL_TIMEOUT", 0.05)
+
+        async def slow_call(name, args):
+            await asyncio.sleep(1)
+
+        self.session.call_tool.side_effect = slow_call
+        result = self.tool._run()
+        assert "timed out" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_stops_background_loop(self):
+        await asyncio.to_thread(self.tool._run)
+        thread = self.toolset._bg_thread
+        assert thread.is_alive()
+        await self.toolset.cleanup()
+        assert self.toolset._bg_loop is None
+        assert not thread.is_alive()
+
+
+class TestLazyImports:
+    """The package should not pull in CrewAI until the toolset is used."""
+
+    def test_package_import_is_lazy(self):
+        code = "import sys, unizo_crewai; print('crewai' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True, cwd=PACKAGE_ROOT,
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_attribute_access_resolves_toolset(self):
+        import unizo_crewai
+        from unizo_crewai.toolset import UnizoCrewAIToolSet
+
+        assert unizo_crewai.UnizoCrewAIToolSet is UnizoCrewAIToolSet
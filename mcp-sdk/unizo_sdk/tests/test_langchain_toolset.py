@@ -1,11 +1,17 @@
 """Unit tests for the LangChain adapter (unizo_langchain.toolset)."""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from types import SimpleNamespace
 
 from unizo_core.actions import Action
 
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
 
 # ===================================================================
 # LangChain StructuredTool conversion
@@ -17,11 +23,10 @@ class TestLangChainToolConversion:
     LangChain StructuredTool instances with correct schemas."""
 
     @pytest.fixture(autouse=True)
-    def setup_toolset(self, mock_session):
+    def setup_toolset(self, make_toolset):
         from unizo_langchain.toolset import UnizoLangChainToolSet
 
-        self.toolset = UnizoLangChainToolSet(api_key="test_key")
-        self.toolset.session = mock_session
+        self.toolset = make_toolset(UnizoLangChainToolSet)
 
     @pytest.mark.asyncio
     async def test_returns_list(self):
@@ -82,15 +87,51 @@ class TestLangChainToolConversion:
             )
 
 
+# ===================================================================
+# Tool coroutines
+# ===================================================================
+
+
+class TestLangChainToolCoroutine:
+    """Each tool's coroutine must call its own action, not the last one built."""
+
+    @pytest.fixture(autouse=True)
+    def setup_toolset(self, make_toolset, mock_session):
+        from unizo_langchain.toolset import UnizoLangChainToolSet
+
+        self.toolset = make_toolset(UnizoLangChainToolSet)
+        self.session = mock_session
+
+    @pytest.mark.asyncio
+    async def test_each_tool_calls_its_own_action(self):
+        tools = await self.toolset.get_tools(actions=[Action.LIST_SERVICES, Action.HEALTH_CHECK])
+        await tools[0].coroutine()
+        self.session.call_tool.assert_awaited_once_with("list_services", {})
+
+    @pytest.mark.asyncio
+    async def test_invalid_params_raise_before_call(self):
+        from unizo_core.exceptions import ToolExecutionError
+
+        tools = await self.toolset.get_tools(actions=[Action.LIST_TICKETS, Action.HEALTH_CHECK])
+        with pytest.raises(ToolExecutionError, match="list_tickets"):
+            await tools[0].coroutine()
+        self.session.call_tool.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_params_passed_through_unchanged(self):
+        tools = await self.toolset.get_tools(actions=[Action.LIST_TICKETS])
+        await tools[0].coroutine(collection_id="c1")
+        self.session.call_tool.assert_awaited_once_with("list_tickets", {"collection_id": "c1"})
+
+
 class TestLangChainSchemaGeneration:
     """Test that dynamically generated Pydantic schemas are well-formed."""
 
     @pytest.fixture(autouse=True)
-    def setup_toolset(self, mock_session):
+    def setup_toolset(self, make_toolset):
         from unizo_langchain.toolset import UnizoLangChainToolSet
 
-        self.toolset = UnizoLangChainToolSet(api_key="test_key")
-        self.toolset.session = mock_session
+        self.toolset = make_toolset(UnizoLangChainToolSet)
 
     @pytest.mark.asyncio
     async def test_schema_json_serialisable(self):
@@ -120,3 +161,40 @@ class TestLangChainSchemaGeneration:
             field = schema.model_fields.get(field_name)
             assert field is not None, f"Missing field: {field_name}"
             assert not field.is_required(), f"Field {field_name} should be optional"
+
+    @pytest.mark.asyncio
+    async def test_args_schema_reused_across_calls(self):
+        first = await self.toolset.get_tools(actions=[Action.CREATE_TICKET])
+        second = await self.toolset.get_tools(actions=[Action.CREATE_TICKET])
+        assert first[0].args_schema is second[0].args_schema
+
+
+
+class TestLazyImports:
+    """The package should not pull in LangChain until the toolset is used."""
+
+    def _loaded_after(self, statement):
+        code = f"import sys; {statement}; print('langchain_core' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True, cwd=PACKAGE_ROOT,
+        )
+        return out.stdout.strip() == "True"
+
+    def test_package_import_is_lazy(self):
+        assert not self._loaded_after("import unizo_langchain")
+
+    def test_toolset_module_import_is_lazy(self):
+        assert not self._loaded_after("import unizo_langchain.toolset")
+
+    def test_attribute_access_resolves_toolset(self):
+        import unizo_langchain
+        from unizo_langchain.toolset import UnizoLangChainToolSet
+
+        assert unizo_langchain.UnizoLangChainToolSet is UnizoLangChainToolSet
+
+    def test_unknown_attribute_raises(self):
+        import unizo_langchain
+
+        with pytest.raises(AttributeError):
+            unizo_langchain.DoesNotExist
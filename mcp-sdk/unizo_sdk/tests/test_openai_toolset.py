@@ -1,5 +1,7 @@
 """Unit tests for the OpenAI adapter (unizo_openai.toolset)."""
 
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from types import SimpleNamespace
@@ -17,16 +19,12 @@ class TestOpenAIToolConversion:
     conform to the OpenAI function-calling specification."""
 
     @pytest.fixture(autouse=True)
-    def setup_toolset(self, mock_session):
+    def setup_toolset(self, make_toolset):
         # Patch AsyncOpenAI so we never hit the real API
         with patch("unizo_openai.toolset.AsyncOpenAI"):
             from unizo_openai.toolset import UnizoOpenAIToolSet
 
-            self.toolset = UnizoOpenAIToolSet(
-                api_key="unizo_test_key",
-                openai_api_key="sk-test",
-            )
-            self.toolset.session = mock_session
+            self.toolset = make_toolset(UnizoOpenAIToolSet, openai_api_key="sk-test")
 
     @pytest.mark.asyncio
     async def test_returns_list_of_dicts(self):
@@ -73,6 +71,43 @@ class TestOpenAIToolConversion:
         assert len(tools) == 1
         assert tools[0]["function"]["name"] == "health_check"
 
+    @pytest.mark.asyncio
+    async def test_full_payload_reused(self):
+        everything = await self.toolset.get_tools()
+        again = await self.toolset.get_tools()
+        assert again is not everything
+        assert all(a is b for a, b in zip(again, everything))
+
+    @pytest.mark.asyncio
+    async def test_caller_mutation_does_not_leak(self):
+        tools = await self.toolset.get_tools()
+        tools.append({"type": "function", "function": {"name": "mine"}})
+        assert len(await self.toolset.get_tools()) == len(tools) - 1
+
+    @pytest.mark.asyncio
+    async def test_selections_not_memoised(self):
+        selected = await self.toolset.get_tools(actions=[Action.HEALTH_CHECK])
+        again = await self.toolset.get_tools(actions=iter([Action.HEALTH_CHECK]))
+        assert again is not selected
+        assert again[0] is selected[0]
+        assert self.toolset._openai_tools_payload is None
+
+    @pytest.mark.asyncio
+    async def test_tool_entries_shared_across_selections(self):
+        everything = {t["function"]["name"]: t for t in await self.toolset.get_tools()}
+        selected = await self.toolset.get_tools(actions=[Action.HEALTH_CHECK, Action.CREATE_TICKET])
+        assert selected[0] is everything["health_check"]
+        assert selected[1] is everything["create_ticket"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_rebuilds_payload(self, mock_session):
+        first = await self.toolset.get_tools()
+        self.toolset.invalidate_tools_cache()
+        rebuilt = await self.toolset.get_tools()
+        assert rebuilt is not first
+        assert rebuilt[0] is not first[0]
+        assert mock_session.list_tools.await_count == 2
+
     @pytest.mark.asyncio
     async def test_no_extra_top_level_keys(self):
         """OpenAI spec only allows 'type' and 'function' at top level."""
@@ -94,9 +129,230 @@ class TestOpenAIToolSetInit:
             ts = UnizoOpenAIToolSet(api_key="unizo_key", openai_api_key="sk-key")
             assert ts.api_key == "unizo_key"
 
+    def test_default_server_url_matches_core(self):
+        from unizo_core.client import DEFAULT_SERVER_URL
+
+        with patch("unizo_openai.toolset.AsyncOpenAI"):
+            from unizo_openai.toolset import UnizoOpenAIToolSet
+
+            ts = UnizoOpenAIToolSet(api_key="unizo_key", openai_api_key="sk-key")
+            assert ts.server_url == DEFAULT_SERVER_URL
+
     def test_empty_unizo_key_raises(self):
         with patch("unizo_openai.toolset.AsyncOpenAI"):
             from unizo_openai.toolset import UnizoOpenAIToolSet
 
             with pytest.raises(ValueError):
                 UnizoOpenAIToolSet(api_key="", openai_api_key="sk-key")
+
+    def test_http_client_is_passed_to_openai(self):
+        http_client = object()
+        with patch("unizo_openai.toolset.AsyncOpenAI") as openai_cls:
+            from unizo_openai.toolset import UnizoOpenAIToolSet
+
+            UnizoOpenAIToolSet(api_key="unizo_key", openai_api_key="sk-key", http_client=http_client)
+            openai_cls.assert_called_once_with(api_key="sk-key", http_client=http_client)
+
+
+# ===================================================================
+# Tool-call argument decoding
+# ===================================================================
+
+
+class TestParseArgs:
+    """_parse_args() short-circuits empty payloads and decodes the rest."""
+
+    @pytest.mark.parametrize("arguments", ["{}", "", None])
+    def test_empty_arguments(self, arguments):
+        from unizo_openai.toolset import _parse_args
+
+        assert _parse_args(arguments) == {}
+
+    def test_empty_result_is_fresh_dict(self):
+        from unizo_openai.toolset import _parse_args
+
+        first = _parse_args("{}")
+        first["mutated"] = True
+        assert _parse_args("{}") == {}
+
+    def test_decodes_object(self):
+        from unizo_openai.toolset import _parse_args
+
+        assert _parse_args('{"collection_id": "c1"}') == {"collection_id": "c1"}
+
+
+# ===================================================================
+# process_query — tool-calling loop
+# ===================================================================
+
+
+def _completion(content=None, tool_calls=None):
+    message = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _tool_call(call_id, name, arguments="{}"):
+    return SimpleNamespace(
+        id=call_id, type="function",
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+class TestProcessQuery:
+    """Tool calls from one completion run together and share one follow-up."""
+
+    @pytest.fixture(autouse=True)
+    def setup_toolset(self, make_toolset, mock_session):
+        with patch("unizo_openai.toolset.AsyncOpenAI"):
+            from unizo_openai.toolset import UnizoOpenAIToolSet
+
+            self.toolset = make_toolset(UnizoOpenAIToolSet, openai_api_key="sk-test")
+        self.toolset.openai = MagicMock()
+        self.create = self.toolset.openai.chat.completions.create = AsyncMock()
+        self.session = mock_session
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently(self, mock_call_tool_result):
+        in_flight = peak = 0
+
+        async def call_tool(name, args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mock_call_tool_result
+
+        self.session.call_tool.side_effect = call_tool
+        self.create.side_effect = [
+            _completion(tool_calls=[
+                _tool_call("call_1", "list_services"),
+                _tool_call("call_2", "health_check"),
+            ]),
+            _completion(content="done"),
+        ]
+
+        text, messages = await self.toolset.process_query("status?")
+
+        assert peak == 2
+        assert self.session.call_tool.await_count == 2
+        assert self.create.await_count == 2
+        first_tools, follow_up_tools = (c.kwargs["tools"] for c in self.create.await_args_list)
+        assert first_tools is follow_up_tools
+        assert first_tools is self.toolset._openai_tools_payload
+        assert text.endswith("done")
+
+    @pytest.mark.asyncio
+    async def test_one_assistant_message_lists_every_call(self):
+        self.create.side_effect = [
+            _completion(tool_calls=[
+                _tool_call("call_1", "list_services"),
+                _tool_call("call_2", "list_tickets", '{"collection_id": "c1"}'),
+            ]),
+            _completion(content="done"),
+        ]
+
+        _, messages = await self.toolset.process_query("status?")
+
+        assistant = [m for m in messages if m["role"] == "assistant" and m.get("tool_calls")]
+        assert len(assistant) == 1
+        assert [c["id"] for c in assistant[0]["tool_calls"]] == ["call_1", "call_2"]
+        assert assistant[0]["tool_calls"][1]["function"]["arguments"] == '{"collection_id": "c1"}'
+        tool_messages = [m for m in messages if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_1", "call_2"]
+        self.session.call_tool.assert_any_await("list_tickets", {"collection_id": "c1"})
+
+    @pytest.mark.asyncio
+    async def test_failed_call_still_answers_its_id(self, mock_call_tool_result):
+        async def call_tool(name, args):
+            if name == "health_check":
+                raise RuntimeError("down")
+            return mock_call_tool_result
+
+        self.session.call_tool.side_effect = call_tool
+        self.create.side_effect = [
+            _completion(tool_calls=[
+                _tool_call("call_1", "list_services"),
+                _tool_call("call_2", "health_check"),
+            ]),
+            _completion(content="done"),
+        ]
+
+        text, messages = await self.toolset.process_query("status?")
+
+        tool_messages = {m["tool_call_id"]: m["content"] for m in messages if m["role"] == "tool"}
+        assert set(tool_messages) == {"call_1", "call_2"}
+        assert "down" in tool_messages["call_2"]
+        assert "[Error calling tool health_check" in text
+        assert self.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unserialisable_result_becomes_error_message(self):
+        self.create.side_effect = [
+            _completion(tool_calls=[
+                _tool_call("call_1", "list_services"),
+                _tool_call("call_2", "health_check"),
+            ]),
+            _completion(content="done"),
+        ]
+        results = {
+            "list_services": SimpleNamespace(structuredContent={"obj": object()}, content=[]),
+            "health_check": SimpleNamespace(structuredContent={"ok": True}, content=[]),
+        }
+        self.session.call_tool.side_effect = lambda name, args: results[name]
+
+        text, messages = await self.toolset.process_query("status?")
+
+        tool_messages = {m["tool_call_id"]: m["content"] for m in messages if m["role"] == "tool"}
+        assert "error" in json.loads(tool_messages["call_1"])
+        assert json.loads(tool_messages["call_2"]) == {"ok": True}
+        assert "[Error calling tool list_services" in text
+        assert text.endswith("done")
+
+    @pytest.mark.asyncio
+    async def test_result_with_int_keys_and_big_ints_sent_to_model(self):
+        self.create.side_effect = [
+            _completion(tool_calls=[_tool_call("call_1", "list_services")]),
+            _completion(content="done"),
+        ]
+        self.session.call_tool.return_value = SimpleNamespace(
+            structuredContent={1: "int key", "big": 2**70}, content=[]
+        )
+
+        text, messages = await self.toolset.process_query("status?")
+
+        (tool_message,) = [m for m in messages if m["role"] == "tool"]
+        assert json.loads(tool_message["content"]) == {"1": "int key", "big": 2**70}
+        assert "[Error calling tool" not in text
+
+    @pytest.mark.asyncio
+    async def test_no_tool_calls_skips_follow_up(self):
+        self.create.return_value = _completion(content="hello")
+
+        text, messages = await self.toolset.process_query("hi")
+
+        assert text == "hello"
+        self.create.assert_awaited_once()
+        self.session.call_tool.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_history_copied_by_default(self):
+        self.create.return_value = _completion(content="hello")
+        history = [{"role": "user", "content": "earlier"}]
+
+        _, messages = await self.toolset.process_query("hi", previous_messages=history)
+
+        assert messages is not history
+        assert history == [{"role": "user", "content": "earlier"}]
+        assert messages[0] == history[0]
+        assert messages[1] == {"role": "user", "content": "hi"}
+
+    @pytest.mark.asyncio
+    async def test_history_extended_in_place_when_not_copying(self):
+        self.create.return_value = _completion(content="hello")
+        history = [{"role": "user", "content": "earlier"}]
+
+        _, messages = await self.toolset.process_query("hi", previous_messages=history, copy_history=False)
+
+        assert messages is history
+        assert [m["content"] for m in history] == ["earlier", "hi", "hello"]
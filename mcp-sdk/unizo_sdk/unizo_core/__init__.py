@@ -1,6 +1,6 @@
 from .client import UnizoToolSet
-from .actions import Action
-from .models import TicketData, Service, Integration, Organization, Collection, TicketSummary
+from .actions import Action, ACTION_BY_NAME
+from .models import TicketData, Service, Integration, Organization, Collection, TicketSummary, ArgsSchema, NoArgs, ACTION_SCHEMAS
 from .exceptions import UnizoError, AuthenticationError, ToolExecutionError
 
-__all__ = ["UnizoToolSet", "Action", "TicketData", "Service", "Integration", "Organization", "Collection", "TicketSummary", "UnizoError", "AuthenticationError", "ToolExecutionError"]
\ No newline at end of file
+__all__ = ["UnizoToolSet", "Action", "ACTION_BY_NAME", "TicketData", "Service", "Integration", "Organization", "Collection", "TicketSummary", "ArgsSchema", "NoArgs", "ACTION_SCHEMAS", "UnizoError", "AuthenticationError", "ToolExecutionError"]
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""JSON codec shared by the toolsets; uses orjson when it is installed."""
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+if orjson is not None:
+    # orjson decodes integers outside the 64-bit range as floats; any run of
+    # 19+ digits could be one, so such documents go through the stdlib parser.
+    # Translating every digit to "0" finds such runs far faster than a regex.
+    _DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+    _LONG_DIGIT_RUN = b"0" * 19
+
+    def loads(raw):
+        data = raw.encode("utf-8", "surrogatepass") if isinstance(raw, str) else bytes(raw)
+        if _LONG_DIGIT_RUN not in data.translate(_DIGITS_TO_ZERO):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity literals and overflowing floats; let the stdlib decide
+        return json.loads(raw)
+
+    def dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Integers wider than 64 bits and other types orjson rejects
+            return json.dumps(obj)
+else:
+    loads = json.loads
+    dumps = json.dumps
\ No newline at end of file
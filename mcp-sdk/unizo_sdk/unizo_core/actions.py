@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Dict
 
 class Action(Enum):
     LIST_SERVICES = "list_services"
@@ -8,4 +9,7 @@ class Action(Enum):
     CONFIRM_TICKET_CREATION = "confirm_ticket_creation"
     CREATE_TICKET = "create_ticket"
     LIST_TICKETS = "list_tickets"
-    HEALTH_CHECK = "health_check"
\ No newline at end of file
+    HEALTH_CHECK = "health_check"
+
+# MCP tool name -> Action; tool names already match the enum values
+ACTION_BY_NAME: Dict[str, Action] = {member.value: member for member in Action}
\ No newline at end of file
@@ -1,9 +1,13 @@
+import asyncio
+import functools
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterable, Mapping, Optional, Tuple
 from contextlib import AsyncExitStack
 from mcp import ClientSession
 from mcp.client.sse import sse_client
+from ._json import loads as _loads
 from .actions import Action
 from .exceptions import UnizoError, AuthenticationError, ToolExecutionError
 
@@ -13,9 +17,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger("unizo-core")
 
+DEFAULT_SERVER_URL = "http://api.unizo.ai/mcp/ticketing"
+
+# Top-level keys that mark an inputSchema as a JSON Schema rather than a flat property map
+_SCHEMA_KEYWORDS = frozenset({
+    "type", "$schema", "$id", "$ref", "$defs", "definitions", "required",
+    "additionalProperties", "patternProperties", "allOf", "anyOf", "oneOf", "not",
+})
+
+
+def _freeze(value: Any) -> Any:
+    """Return a deep read-only view of parsed JSON: mappings become proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return plain, caller-owned dicts and lists for a value built by _freeze()."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_schema(raw: str) -> Mapping[str, Any]:
+    """Parse a JSON-string inputSchema once; the deep-frozen result is shared across calls."""
+    return _freeze(_loads(raw))
+
 
 class UnizoToolSet:
-    def __init__(self, api_key: str, server_url: str = "http://api.unizo.ai/mcp/ticketing"):
+    """Client for the Unizo MCP server.
+
+    Use as an async context manager to hold one SSE session for the whole block::
+
+        async with UnizoToolSet(api_key=...) as toolset:
+            tools = await toolset.get_tools()
+    """
+    # Subclasses declare their own extra attributes in __slots__ as well
+    __slots__ = ("api_key", "server_url", "session", "exit_stack", "_tools_cache", "_tools_cache_lock")
+
+    def __init__(self, api_key: str, server_url: str = DEFAULT_SERVER_URL):
         if not api_key:
             logger.error("UNIZO_API_KEY is not provided or empty")
             raise ValueError("UNIZO_API_KEY is required")
@@ -23,68 +69,143 @@ class UnizoToolSet:
         self.server_url = server_url
         self.session = None
         self.exit_stack = AsyncExitStack()
+        # (MCP tools by name, schemas built so far by name); None until fetched
+        self._tools_cache: Optional[Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]] = None
+        self._tools_cache_lock = asyncio.Lock()
         logger.info("UnizoToolSet initialized")
 
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
+
     async def connect(self):
-        """Connect to the Unizo MCP server using SSE."""
+        """Connect to the Unizo MCP server using SSE; a no-op when already connected."""
+        if self.session is not None:
+            return
         logger.debug(f"Connecting to SSE MCP server at {self.server_url}")
         headers = {"apikey": self.api_key}
-        self._streams_context = sse_client(url=self.server_url, headers=headers)
-        streams = await self._streams_context.__aenter__()
-        self._session_context = ClientSession(*streams)
-        self.session = await self._session_context.__aenter__()
-        await self.session.initialize()
-        response = await self.session.list_tools()
+        # The exit stack owns both contexts; cleanup() unwinds them in reverse order
+        try:
+            streams = await self.exit_stack.enter_async_context(sse_client(url=self.server_url, headers=headers))
+            session = await self.exit_stack.enter_async_context(ClientSession(*streams))
+            await session.initialize()
+            response = await session.list_tools()
+        except BaseException:
+            # Unwind a half-open connection so the next connect() starts clean
+            await self.exit_stack.aclose()
+            raise
+        self.session = session
         tools = response.tools
+        self._tools_cache = self._index_tools(response)
         logger.info(f"Connected to Unizo MCP Server. Available tools: {[tool.name for tool in tools]}")
 
-    async def get_tools(self, actions: Optional[List[Action]] = None) -> List[Dict[str, Any]]:
-        """Fetch tool schemas from the MCP server."""
+    async def get_tools(self, actions: Optional[Iterable[Action]] = None) -> List[Dict[str, Any]]:
+        """Fetch tool schemas from the MCP server.
+
+        ``actions`` restricts the result to those tools, in the given order;
+        ``None`` returns every tool and an empty iterable returns none.
+        Schemas are cached until ``invalidate_tools_cache()`` or ``cleanup()``;
+        treat the returned dicts as read-only.
+        """
+        wanted = None
+        if actions is not None:
+            # Consumed once; duplicates dropped, caller order kept
+            wanted = dict.fromkeys(action.value for action in actions)
+            if not wanted:
+                return []
         if not self.session:
             await self.connect()
         try:
-            response = await self.session.list_tools()
+            by_name, schemas = await self._cached_tools()
+            names = by_name if wanted is None else [name for name in wanted if name in by_name]
+            # Schemas are built on first request only, so filtered calls skip the rest
             tools = []
-            for tool in response.tools:
-                # Parse inputSchema if it's a JSON string
-                input_schema = tool.inputSchema
-                if isinstance(input_schema, str):
-                    try:
-                        input_schema = json.loads(input_schema)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse inputSchema for tool {tool.name}: {str(e)}")
-                        input_schema = {}
-                logger.debug(f"Raw inputSchema for {tool.name}: {input_schema}")
-
-                tools.append({
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": {
-                        "type": "object",
-                        "properties": dict(input_schema) if input_schema else {},
-                        "required": input_schema.get("required", []) if input_schema else []
-                    }
-                })
-            if actions:
-                action_names = [action.value for action in actions]
-                tools = [tool for tool in tools if tool["name"] in action_names]
+            for name in names:
+                schema = schemas.get(name)
+                if schema is None:
+                    schema = schemas[name] = self._tool_schema(by_name[name])
+                tools.append(schema)
             logger.info(f"Fetched {len(tools)} tools")
-            logger.debug(f"Tool schemas: {tools}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Tool schemas: %s", tools)
             return tools
         except Exception as e:
             logger.error(f"Error fetching tools: {str(e)}")
             raise ToolExecutionError(f"Failed to fetch tools: {str(e)}")
 
+    async def _cached_tools(self) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """Return the tools and their built schemas, fetching from the server only on a cache miss."""
+        tools_cache = self._tools_cache
+        if tools_cache is not None:
+            return tools_cache
+        async with self._tools_cache_lock:
+            if self._tools_cache is None:
+                response = await self.session.list_tools()
+                self._tools_cache = self._index_tools(response)
+            return self._tools_cache
+
+    @staticmethod
+    def _index_tools(response) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """Key a list_tools() response by tool name, with an empty schema memo."""
+        return {tool.name: tool for tool in response.tools}, {}
+
+    def invalidate_tools_cache(self):
+        """Drop the cached tool schemas so the next get_tools() refetches them."""
+        self._tools_cache = None
+
+    @staticmethod
+    def _tool_schema(tool) -> Dict[str, Any]:
+        """Convert an MCP tool into the SDK's tool schema dict."""
+        # Parse inputSchema if it's a JSON string
+        input_schema = tool.inputSchema
+        if isinstance(input_schema, str):
+            try:
+                # Thaw the shared cached parse so no caller can mutate it
+                input_schema = _thaw(_parse_schema(input_schema))
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse inputSchema for tool {tool.name}: {str(e)}")
+                input_schema = {}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw inputSchema for %s: %s", tool.name, input_schema)
+
+        # Downstream code only reads these, so the parsed objects are shared, not copied
+        properties = input_schema.get("properties") if input_schema else {}
+        if properties is None:
+            # A flat schema lists the properties at the top level; a JSON Schema
+            # without "properties" (e.g. {"type": "object"}) takes no arguments
+            is_flat = _SCHEMA_KEYWORDS.isdisjoint(input_schema) and all(
+                isinstance(value, Mapping) for value in input_schema.values()
+            )
+            properties = dict(input_schema) if is_flat else {}
+        required = input_schema.get("required", []) if input_schema else []
+
+        return {
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": {
+                "type": "object",
+                "properties": properties,
+                "required": required
+            }
+        }
+
     async def execute_action(self, action: Action, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a specific action directly."""
         if not self.session:
             await self.connect()
         try:
             result = await self.session.call_tool(action.value, params)
-            tool_result = result.structuredContent if hasattr(result,
-                                                              'structuredContent') and result.structuredContent else [
-                json.loads(content.text) for content in result.content if hasattr(content, 'text')
-            ]
+            structured = getattr(result, 'structuredContent', None)
+            if structured:
+                tool_result = structured
+            else:
+                # Non-text blocks (images, resources) and empty text are skipped
+                tool_result = [
+                    _loads(text) for content in result.content if (text := getattr(content, 'text', None))
+                ]
             logger.info(f"Executed action {action.value} successfully")
             return tool_result[0] if isinstance(tool_result, list) and len(tool_result) == 1 else tool_result
         except Exception as e:
@@ -93,9 +214,7 @@ class UnizoToolSet:
 
     async def cleanup(self):
         """Clean up resources."""
+        self.invalidate_tools_cache()
         await self.exit_stack.aclose()
-        if hasattr(self, '_session_context') and self._session_context:
-            await self._session_context.__aexit__(None, None, None)
-        if hasattr(self, '_streams_context') and self._streams_context:
-            await self._streams_context.__aexit__(None, None, None)
+        self.session = None
         logger.info("UnizoToolSet cleaned up")
\ No newline at end of file
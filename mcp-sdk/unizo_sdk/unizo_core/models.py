@@ -1,5 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+import copy
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, Optional, Type
+from .actions import Action
 
 class TicketData(BaseModel):
     name: str = Field(..., description="Ticket name/title")
@@ -28,4 +30,32 @@ class TicketSummary(BaseModel):
     id: str
     name: str
     type: str
-    status: str
\ No newline at end of file
+    status: str
+
+class ArgsSchema(BaseModel):
+    """Base for tool argument models built from MCP input schemas.
+
+    These models never change once built, so the default ``model_json_schema()``
+    output is generated once per class and handed out as a copy.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        if args or kwargs:
+            return super().model_json_schema(*args, **kwargs)
+        cached = cls.__dict__.get("__json_schema_cache__")
+        if cached is None:
+            cached = super().model_json_schema()
+            cls.__json_schema_cache__ = cached
+        return copy.deepcopy(cached)
+
+class NoArgs(ArgsSchema):
+    """Args model for tools that take no parameters."""
+
+# Hand-written args models for known actions; build_args_schema() uses one only
+# while its fields still match the schema the server advertises
+ACTION_SCHEMAS: Dict[Action, Type[ArgsSchema]] = {
+    Action.LIST_SERVICES: NoArgs,
+    Action.HEALTH_CHECK: NoArgs,
+}
\ No newline at end of file
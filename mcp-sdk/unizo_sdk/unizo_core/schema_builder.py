@@ -0,0 +1,85 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Tuple, Type
+from pydantic import BaseModel, create_model
+from .actions import ACTION_BY_NAME
+from .models import ACTION_SCHEMAS, ArgsSchema
+
+# Shared by every adapter so the same tool schema maps to one model class;
+# bounded LRU so servers that churn schemas cannot grow it without limit
+_SCHEMA_CACHE_MAXSIZE = 256
+_SCHEMA_CACHE: "OrderedDict[Tuple[str, str], Type[BaseModel]]" = OrderedDict()
+
+# JSON schema type -> Python field type; anything unknown or missing is a str
+_TYPE_MAP: Dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+def _schema_digest(schema: Dict[str, Any]) -> str:
+    """Return a stable digest of a JSON schema, independent of key order."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8")).hexdigest()
+
+
+def _cache_schema(key: Tuple[str, str], args_schema: Type[BaseModel]):
+    _SCHEMA_CACHE[key] = args_schema
+    if len(_SCHEMA_CACHE) > _SCHEMA_CACHE_MAXSIZE:
+        _SCHEMA_CACHE.popitem(last=False)
+
+
+def _field_entry(prop_schema: Any, is_required: bool) -> Tuple[type, Any]:
+    """Return the ``create_model`` field definition for one schema property."""
+    schema_type = prop_schema.get("type") if isinstance(prop_schema, dict) else None
+    if isinstance(schema_type, list):
+        # Union such as ["string", "null"]: use the first non-null member
+        schema_type = next((t for t in schema_type if t != "null"), None)
+    prop_type = _TYPE_MAP.get(schema_type, str) if isinstance(schema_type, str) else str
+    return prop_type, ... if is_required else None
+
+
+def _matches_schema(model: Type[BaseModel], input_schema: Dict[str, Any]) -> bool:
+    """Return True if ``model`` has exactly the schema's properties and required set."""
+    fields = model.model_fields
+    required = {name for name, field in fields.items() if field.is_required()}
+    return (set(fields) == set(input_schema.get("properties", {}))
+            and required == set(input_schema.get("required", [])))
+
+
+def build_args_schema(tool_name: str, input_schema: Dict[str, Any]) -> Type[BaseModel]:
+    """Build the Pydantic args model for a tool, reusing it for identical schemas."""
+    key = (tool_name, _schema_digest(input_schema))
+    args_schema = _SCHEMA_CACHE.get(key)
+    if args_schema is not None:
+        _SCHEMA_CACHE.move_to_end(key)
+        return args_schema
+
+    # Known actions reuse their hand-written model unless the server schema has drifted
+    args_schema = ACTION_SCHEMAS.get(ACTION_BY_NAME.get(tool_name))
+    if args_schema is not None and _matches_schema(args_schema, input_schema):
+        _cache_schema(key, args_schema)
+        return args_schema
+
+    # Create fields for Pydantic model
+    required = set(input_schema.get("required", []))
+    fields = {
+        prop_name: _field_entry(prop_schema, prop_name in required)
+        for prop_name, prop_schema in input_schema.get("properties", {}).items()
+    }
+
+    # create_model() yields the same core schema as a hand-written class; emitting
+    # class source and exec()-ing it measured no faster, and the cache above
+    # already limits the cost to one build per unique schema.
+    args_schema = create_model(
+        f"{tool_name}Schema",
+        __base__=ArgsSchema,
+        **fields
+    )
+    _cache_schema(key, args_schema)
+    return args_schema
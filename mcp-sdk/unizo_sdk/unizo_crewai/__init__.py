@@ -1,3 +1,9 @@
-from .toolset import UnizoCrewAIToolSet
+__all__ = ["UnizoCrewAIToolSet"]
 
-__all__ = ["UnizoCrewAIToolSet"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Defer importing the toolset (and its framework) until it is first used
+    if name == "UnizoCrewAIToolSet":
+        from .toolset import UnizoCrewAIToolSet
+        return UnizoCrewAIToolSet
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
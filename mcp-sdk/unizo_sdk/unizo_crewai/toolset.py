@@ -1,14 +1,19 @@
-import json
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, create_model
+import concurrent.futures
+import threading
+from typing import List, Dict, Any, Iterable, Optional
+from pydantic import BaseModel
 from crewai.tools import BaseTool
-from unizo_core import UnizoToolSet, Action
-from unizo_core.exceptions import ToolExecutionError
+from unizo_core import UnizoToolSet, Action, ACTION_BY_NAME
+from unizo_core.client import DEFAULT_SERVER_URL
+from unizo_core.schema_builder import build_args_schema
 
 logger = logging.getLogger("unizo-crewai")
 
+# Seconds a single tool call may take, sync or async
+_TOOL_TIMEOUT = 30.0
+
 class UnizoCrewAITool(BaseTool):
     """Custom CrewAI tool for Unizo actions."""
     def __init__(self, name: str, description: str, toolset: 'UnizoCrewAIToolSet', action: Action, args_schema: BaseModel):
@@ -20,32 +25,137 @@ class UnizoCrewAITool(BaseTool):
     async def _async_run(self, **params: Any) -> Dict[str, Any]:
         """Execute the tool asynchronously with timeout."""
         try:
-            logger.debug(f"Tool {self.name} called with params: {params}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Tool %s called with params: %s", self.name, params)
             return await asyncio.wait_for(
                 self._toolset.execute_action(self._action, params),
-                timeout=30.0
+                timeout=_TOOL_TIMEOUT
             )
         except asyncio.TimeoutError:
             logger.error(f"Tool {self.name} timed out")
-            return {"error": f"Tool {self.name} timed out after 30 seconds"}
+            return {"error": f"Tool {self.name} timed out after {_TOOL_TIMEOUT:.0f} seconds"}
         except Exception as e:
             logger.error(f"Error executing tool {self.name}: {str(e)}")
             return {"error": f"Failed to execute {self.name}: {str(e)}"}
 
     def _run(self, **params: Any) -> Dict[str, Any]:
-        """Execute the tool synchronously."""
+        """Execute the tool synchronously on the toolset's persistent event loop."""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                return loop.run_until_complete(self._async_run(**params))
-            else:
-                return asyncio.run(self._async_run(**params))
+            loop = self._toolset._sync_loop()
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                # Blocking here would stop the loop that has to run the call
+                raise RuntimeError("cannot block on the event loop that owns the MCP session")
+            future = asyncio.run_coroutine_threadsafe(self._async_run(**params), loop)
+            try:
+                return future.result(timeout=_TOOL_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                logger.error(f"Tool {self.name} timed out")
+                return {"error": f"Tool {self.name} timed out after {_TOOL_TIMEOUT:.0f} seconds"}
         except Exception as e:
             logger.error(f"Error in _run for tool {self.name}: {str(e)}")
             return {"error": f"Failed to execute {self.name}: {str(e)}"}
 
 class UnizoCrewAIToolSet(UnizoToolSet):
-    async def get_tools(self, actions: Optional[List[Action]] = None) -> List[BaseTool]:
+    __slots__ = ("_session_loop", "_bg_loop", "_bg_thread", "_bg_lock",
+                 "_owner_task", "_owner_ready", "_owner_shutdown")
+
+    def __init__(self, api_key: str, server_url: str = DEFAULT_SERVER_URL):
+        super().__init__(api_key, server_url)
+        # Loop that owns the MCP session, and a background loop for sync callers
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_thread: Optional[threading.Thread] = None
+        self._bg_lock = threading.Lock()
+        # Task on the background loop that opens, holds and closes the session there
+        self._owner_task: Optional[asyncio.Task] = None
+        self._owner_ready: Optional[asyncio.Future] = None
+        self._owner_shutdown: Optional[asyncio.Event] = None
+
+    async def connect(self):
+        """Connect and remember which event loop the session lives on."""
+        if self.session is not None:
+            return
+        loop = asyncio.get_running_loop()
+        if loop is not self._bg_loop:
+            await super().connect()
+            self._session_loop = loop
+            return
+        # anyio requires the SSE contexts to be exited by the task that entered
+        # them, so on the background loop one long-lived task owns the session
+        if self._owner_ready is None:
+            self._owner_ready = loop.create_future()
+            self._owner_shutdown = asyncio.Event()
+            self._owner_task = loop.create_task(self._own_session(self._owner_ready, self._owner_shutdown))
+        await asyncio.shield(self._owner_ready)
+
+    async def _own_session(self, ready: asyncio.Future, shutdown: asyncio.Event):
+        """Open the session, hold it until shutdown is signalled, then close it from this task."""
+        try:
+            await super().connect()
+        except Exception as e:
+            self._owner_task = self._owner_ready = self._owner_shutdown = None
+            ready.set_exception(e)
+            return
+        self._session_loop = asyncio.get_running_loop()
+        ready.set_result(None)
+        try:
+            await shutdown.wait()
+        finally:
+            self._owner_task = self._owner_ready = self._owner_shutdown = None
+            await super().cleanup()
+
+    @staticmethod
+    async def _close_owned(owner_task: asyncio.Task, shutdown: asyncio.Event):
+        shutdown.set()
+        await owner_task
+
+    async def cleanup(self):
+        """Close the session from the task that opened it, then stop the background loop."""
+        try:
+            owner_task = self._owner_task
+            if owner_task is None:
+                await super().cleanup()
+            else:
+                closing = self._close_owned(owner_task, self._owner_shutdown)
+                if asyncio.get_running_loop() is self._bg_loop:
+                    await closing
+                else:
+                    await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(closing, self._bg_loop))
+        finally:
+            self._session_loop = None
+            self._stop_bg_loop()
+
+    def _sync_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the loop sync tool calls run on, starting the background one on first use."""
+        loop = self._session_loop
+        if loop is not None and loop.is_running():
+            return loop
+        with self._bg_lock:
+            if self._bg_loop is None:
+                bg_loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=bg_loop.run_forever, name="unizo-crewai-loop", daemon=True)
+                thread.start()
+                self._bg_loop, self._bg_thread = bg_loop, thread
+            return self._bg_loop
+
+    def _stop_bg_loop(self):
+        with self._bg_lock:
+            loop, thread = self._bg_loop, self._bg_thread
+            self._bg_loop = self._bg_thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+            if not thread.is_alive():
+                loop.close()
+
+    async def get_tools(self, actions: Optional[Iterable[Action]] = None) -> List[BaseTool]:
         """Convert MCP tools to CrewAI-compatible tools."""
         tools = await super().get_tools(actions)
         crewai_tools = []
@@ -54,29 +164,13 @@ class UnizoCrewAIToolSet(UnizoToolSet):
             description = tool.get("description", f"Execute {name}")
             schema = tool.get("parameters", {"type": "object", "properties": {}, "required": []})
 
-            # Create fields for Pydantic model
-            fields = {}
-            for prop_name, prop_schema in schema.get("properties", {}).items():
-                prop_type = str
-                if isinstance(prop_schema, dict):
-                    schema_type = prop_schema.get("type")
-                    if schema_type == "integer":
-                        prop_type = int
-                    elif schema_type == "boolean":
-                        prop_type = bool
-                fields[prop_name] = (prop_type, None if prop_name not in schema.get("required", []) else ...)
-
-            args_schema = create_model(
-                f"{name}Schema",
-                __config__={"arbitrary_types_allowed": True},
-                **fields
-            )
+            args_schema = build_args_schema(name, schema)
 
             crewai_tools.append(UnizoCrewAITool(
                 name=name,
                 description=description,
                 toolset=self,
-                action=Action[name.upper()],
+                action=ACTION_BY_NAME[name],
                 args_schema=args_schema
             ))
         logger.info(f"Converted {len(crewai_tools)} tools for CrewAI")
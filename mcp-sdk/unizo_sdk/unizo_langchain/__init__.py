@@ -1,3 +1,9 @@
-from .toolset import UnizoLangChainToolSet
+__all__ = ["UnizoLangChainToolSet"]
 
-__all__ = ["UnizoLangChainToolSet"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Defer importing the toolset (and its framework) until it is first used
+    if name == "UnizoLangChainToolSet":
+        from .toolset import UnizoLangChainToolSet
+        return UnizoLangChainToolSet
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,41 +1,105 @@
-import json
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import httpx
+from typing import List, Dict, Any, Iterable, Optional
 from openai import AsyncOpenAI
-from unizo_core import UnizoToolSet, Action
+from unizo_core import UnizoToolSet, Action, ACTION_BY_NAME
+from unizo_core._json import loads, dumps
+from unizo_core.client import DEFAULT_SERVER_URL
 from unizo_core.exceptions import ToolExecutionError
 
 logger = logging.getLogger("unizo-openai")
 
+
+def _parse_args(arguments: Optional[str]) -> Dict[str, Any]:
+    """Decode tool-call arguments, skipping the parser for the common empty object."""
+    if not arguments or arguments == "{}":
+        return {}
+    return loads(arguments)
+
+
 class UnizoOpenAIToolSet(UnizoToolSet):
-    def __init__(self, api_key: str, openai_api_key: str, server_url: str = "http://api.unizo.ai/mcp/ticketing"):
+    __slots__ = ("openai", "_openai_tools_payload", "_openai_tool_entries")
+
+    def __init__(self, api_key: str, openai_api_key: str, server_url: str = DEFAULT_SERVER_URL,
+                 http_client: Optional[httpx.AsyncClient] = None):
+        """Pass ``http_client`` to share one connection pool across OpenAI clients."""
         super().__init__(api_key, server_url)
-        self.openai = AsyncOpenAI(api_key=openai_api_key)
+        self.openai = AsyncOpenAI(api_key=openai_api_key, http_client=http_client)
+        # OpenAI tools payload for all tools; selections are assembled from the entries
+        self._openai_tools_payload: Optional[List[Dict[str, Any]]] = None
+        # One function entry per tool name, shared by every list handed out
+        self._openai_tool_entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    async def get_tools(self, actions: Optional[Iterable[Action]] = None) -> List[Dict[str, Any]]:
+        """Convert MCP tools to OpenAI-compatible function schemas.
+
+        Each tool's entry is built once and shared until the tool cache is
+        invalidated; treat the entries as read-only. The returned list is the
+        caller's own.
+        """
+        if actions is None:
+            return list(await self._all_openai_tools())
+        return await self._build_openai_tools(actions)
+
+    async def _all_openai_tools(self) -> List[Dict[str, Any]]:
+        """Return the memoised payload for all tools; callers must not mutate it."""
+        payload = self._openai_tools_payload
+        if payload is None:
+            payload = await self._build_openai_tools(None)
+        return payload
+
+    async def _build_openai_tools(self, actions: Optional[Iterable[Action]]) -> List[Dict[str, Any]]:
+        entries = self._openai_tool_entries
+        if entries is None:
+            entries = self._openai_tool_entries = {}
 
-    async def get_tools(self, actions: Optional[List[Action]] = None) -> List[Dict[str, Any]]:
-        """Convert MCP tools to OpenAI-compatible function schemas."""
         tools = await super().get_tools(actions)
-        openai_tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.get("name"),
-                    "description": tool.get("description", f"Execute {tool.get('name')}"),
-                    "parameters": tool.get("parameters", {"type": "object", "properties": {}})
+        openai_tools = []
+        for tool in tools:
+            name = tool.get("name")
+            entry = entries.get(name)
+            if entry is None:
+                entry = entries[name] = {
+                    "type": "function",
+                    "function": {
+                        "name": name,
+                        "description": tool.get("description", f"Execute {name}"),
+                        "parameters": tool.get("parameters", {"type": "object", "properties": {}})
+                    }
                 }
-            }
-            for tool in tools
-        ]
+            openai_tools.append(entry)
         logger.info(f"Converted {len(openai_tools)} tools for OpenAI")
+        # Only the unfiltered list is kept, so varied selections cannot grow the cache
+        if actions is None and entries is self._openai_tool_entries:
+            self._openai_tools_payload = openai_tools
         return openai_tools
 
-    async def process_query(self, query: str, previous_messages: List[Dict[str, Any]] = None, model: str = "gpt-4o") -> tuple[str, List[Dict[str, Any]]]:
-        """Process a query using OpenAI with tool calling."""
+    def invalidate_tools_cache(self):
+        """Drop the cached tool schemas and the OpenAI payloads built from them."""
+        super().invalidate_tools_cache()
+        self._openai_tools_payload = self._openai_tool_entries = None
+
+    async def process_query(self, query: str, previous_messages: List[Dict[str, Any]] = None, model: str = "gpt-4o",
+                            copy_history: bool = True) -> tuple[str, List[Dict[str, Any]]]:
+        """Process a query using OpenAI with tool calling.
+
+        ``previous_messages`` is copied by default. Pass ``copy_history=False``
+        to have the new messages appended to that list in place, which avoids
+        re-copying a long history on every turn; the same list is returned.
+        """
         if not self.session:
             await self.connect()
-        messages = previous_messages.copy() if previous_messages else []
-        messages.append({"role": "user", "content": query})
-        tools = await self.get_tools()
+        user_message = {"role": "user", "content": query}
+        if previous_messages is None:
+            messages = [user_message]
+        elif copy_history:
+            messages = [*previous_messages, user_message]
+        else:
+            messages = previous_messages
+            messages.append(user_message)
+        # Internal list, so both completions below get the same object
+        tools = await self._all_openai_tools()
 
         try:
             response = await self.openai.chat.completions.create(
@@ -56,48 +120,65 @@ class UnizoOpenAIToolSet(UnizoToolSet):
             messages.append({"role": "assistant", "content": choice.message.content})
 
         if choice.message.tool_calls:
-            tool_calls = []
-            for tool_call in choice.message.tool_calls:
-                tool_name = tool_call.function.name
-                tool_args = json.loads(tool_call.function.arguments)
-                try:
-                    result = await self.execute_action(Action[tool_name.upper()], tool_args)
-                    final_text.append(f"[Tool {tool_name} result: {result}]")
-                    tool_calls.append({
+            tool_calls = choice.message.tool_calls
+            # Run every requested tool at once; one failure must not cancel the rest
+            results = await asyncio.gather(
+                *(self._run_tool_call(tool_call) for tool_call in tool_calls),
+                return_exceptions=True
+            )
+            messages.append({
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
                         "id": tool_call.id,
                         "type": "function",
-                        "function": {"name": tool_name, "arguments": json.dumps(tool_args)}
-                    })
-                    messages.append({
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": tool_calls
-                    })
-                    messages.append({
-                        "role": "tool",
-                        "content": json.dumps(result),
-                        "tool_call_id": tool_call.id
-                    })
-                except Exception as e:
-                    logger.error(f"Tool call error for {tool_name}: {e}")
-                    final_text.append(f"[Error calling tool {tool_name}: {str(e)}]")
-                    continue
-
-                # Follow-up call
-                try:
-                    next_response = await self.openai.chat.completions.create(
-                        model=model,
-                        messages=messages,
-                        tools=tools,
-                        tool_choice="auto",
-                        max_tokens=1000
-                    )
-                    next_content = next_response.choices[0].message.content
-                    if next_content:
-                        final_text.append(next_content)
-                        messages.append({"role": "assistant", "content": next_content})
-                except Exception as e:
-                    logger.error(f"OpenAI follow-up API error: {e}")
-                    final_text.append(f"[Error in follow-up response: {str(e)}]")
-
-        return "\n".join(final_text), messages
\ No newline at end of file
+                        "function": {"name": tool_call.function.name, "arguments": tool_call.function.arguments}
+                    }
+                    for tool_call in tool_calls
+                ]
+            })
+            for tool_call, result in zip(tool_calls, results):
+                tool_name = tool_call.function.name
+                if not isinstance(result, Exception):
+                    try:
+                        content = dumps(result)
+                    except Exception as e:
+                        # Unserialisable results (e.g. arbitrary objects) are reported like failed calls
+                        result = e
+                if isinstance(result, Exception):
+                    logger.error(f"Tool call error for {tool_name}: {result}")
+                    final_text.append(f"[Error calling tool {tool_name}: {str(result)}]")
+                    content = dumps({"error": str(result)})
+                else:
+                    final_text.append(f"[Tool {tool_name} result: {result}]")
+                # Every tool_call id needs a matching tool message, including failed ones
+                messages.append({
+                    "role": "tool",
+                    "content": content,
+                    "tool_call_id": tool_call.id
+                })
+
+            # Single follow-up call covering all tool results
+            try:
+                next_response = await self.openai.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    tools=tools,
+                    tool_choice="auto",
+                    max_tokens=1000
+                )
+                next_content = next_response.choices[0].message.content
+                if next_content:
+                    final_text.append(next_content)
+                    messages.append({"role": "assistant", "content": next_content})
+            except Exception as e:
+                logger.error(f"OpenAI follow-up API error: {e}")
+                final_text.append(f"[Error in follow-up response: {str(e)}]")
+
+        return "\n".join(final_text), messages
+
+    async def _run_tool_call(self, tool_call) -> Any:
+        """Decode one tool call's arguments and execute it."""
+        tool_args = _parse_args(tool_call.function.arguments)
+        return await self.execute_action(ACTION_BY_NAME[tool_call.function.name], tool_args)
\ No newline at end of file